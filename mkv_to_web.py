@@ -9,15 +9,27 @@ This script uses FFmpeg directly to convert MKV to WebP
 import os
 import sys
 import subprocess
+import tempfile
 import argparse
+import functools
 import shutil
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
 
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg():
-    """Check if FFmpeg is available"""
+    """Check if FFmpeg is available (cached for the process lifetime)"""
+    # A PATH scan is enough to answer this and spawns no process; keep
+    # the version probe only as a fallback for odd setups where which()
+    # misses a runnable ffmpeg
+    if shutil.which('ffmpeg'):
+        return True
     try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True)
+        # Only the exit code matters; don't capture or decode the banner
+        result = subprocess.run(['ffmpeg', '-version'],
+                              stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL)
         if result.returncode == 0:
             return True
     except FileNotFoundError:
@@ -38,9 +50,14 @@ def convert_mkv_to_webp(input_file, output_file=None,
                        start_time=0, duration=None,
                        fps=12, width=None, height=None,
                        quality=80, lossless=False,
-                       loop=True, verbose=False):
+                       loop=True, verbose=False,
+                       threads=None, hwaccel=True,
+                       method=4, accurate_seek=False,
+                       info=None):
     """
     Convert MKV to WebP using FFmpeg
+
+    Returns (output_path, size_bytes) on success, None on failure
     """
     
     # Check if FFmpeg is available
@@ -61,71 +78,161 @@ def convert_mkv_to_webp(input_file, output_file=None,
     
     print(f"Converting {input_file} to {output_file}...")
     
-    # Build FFmpeg command
-    cmd = ['ffmpeg']
-    
-    # Input file
-    cmd.extend(['-i', input_file])
-    
-    # Time constraints
+    # Precompute the argument groups, then build the command in one
+    # literal instead of growing the list a few elements at a time
+
+    # Time constraints; -ss before -i seeks at the container level so
+    # the prefix is never decoded, while output-side -ss decodes and
+    # discards but lands frame-accurately
+    seek_args = ()
+    time_args = ()
     if start_time > 0:
-        cmd.extend(['-ss', str(start_time)])
+        if accurate_seek:
+            time_args += ('-ss', str(start_time))
+        else:
+            seek_args += ('-ss', str(start_time))
     if duration:
-        cmd.extend(['-t', str(duration)])
-    
-    # Video filters
+        time_args += ('-t', str(duration))
+
+    # Video filters; reuse the caller's probe when one was passed in
+    if info is None:
+        info = get_video_info(input_file)
+    src_fps = info['fps'] if info else None
+    src_w = info['width'] if info else None
+    src_h = info['height'] if info else None
+
     filters = []
-    
-    # Resize
+
+    # Frame selection: when the source frame rate is an integer multiple
+    # of the target, pick every Nth frame at the decoder instead of
+    # letting -r drop frames after a full decode. Non-integer ratios
+    # must keep -r: stamping every Nth frame at the target rate would
+    # stretch playback (30 fps via step=2 plays 25% slow at 12 fps)
+    if src_fps and src_fps > fps:
+        remainder = src_fps % fps
+        divides = min(remainder, fps - remainder) < 0.01
+        step = round(src_fps / fps) if divides else 0
+    else:
+        step = 0
+    if step > 1:
+        filters.append(f"select='not(mod(n,{step}))'")
+
+    # Resize; skip the swscale pass when the source already has the
+    # requested geometry
     if width and height:
-        filters.append(f'scale={width}:{height}')
+        if width != src_w or height != src_h:
+            filters.append(f'scale={width}:{height}')
     elif width:
-        filters.append(f'scale={width}:-1')
+        if width != src_w:
+            filters.append(f'scale={width}:-1')
     elif height:
-        filters.append(f'scale=-1:{height}')
-    
+        if height != src_h:
+            filters.append(f'scale=-1:{height}')
+
     # Frame rate
-    cmd.extend(['-r', str(fps)])
-    
-    # Apply filters
-    if filters:
-        cmd.extend(['-vf', ','.join(filters)])
-    
-    # WebP options
-    if lossless:
-        cmd.extend(['-lossless', '1'])
+    if step > 1:
+        # Rewrite timestamps for the selected frames and keep them as-is
+        filters.append(f'setpts=N/({fps}*TB)')
+        rate_args = ('-vsync', 'vfr')
+    elif src_fps and src_fps <= fps:
+        # Source is already at or below the target; a CFR pass would
+        # only duplicate frames
+        rate_args = ()
     else:
-        cmd.extend(['-quality', str(quality)])
-    
+        rate_args = ('-r', str(fps))
+
+    filter_args = ('-vf', ','.join(filters)) if filters else ()
+
+    # WebP options
+    webp_args = ('-lossless', '1') if lossless else ('-quality', str(quality))
+
+    # libwebp effort knob: higher = more encoder CPU, smaller files
+    webp_args += ('-compression_level', str(method))
+
+    # -threads 0 lets ffmpeg size its pool to the machine; batch mode
+    # passes an explicit cap since several encodes run at once
+    webp_args += ('-threads', str(threads) if threads else '0')
+
     # Loop (0 = infinite)
     if loop:
-        cmd.extend(['-loop', '0'])
-    
-    # Overwrite output file
-    cmd.extend(['-y', output_file])
-    
-    # Verbose output
-    if not verbose:
-        cmd.extend(['-loglevel', 'error'])
-    
+        webp_args += ('-loop', '0')
+
+    log_args = () if verbose else ('-loglevel', 'error')
+
+    # Let ffmpeg use the GPU's fixed-function decoder when one exists;
+    # the libwebp encode stays on the CPU either way
+    hw_args = ('-hwaccel', 'auto') if hwaccel else ()
+
+    cmd_tail = [*seek_args, '-i', input_file, *time_args, *rate_args,
+                *filter_args, *webp_args, *log_args, '-y', output_file]
+    cmd = ['ffmpeg', *hw_args, *cmd_tail]
+
+    # -hwaccel auto already degrades to software when no accelerator
+    # exists, so a nonzero exit is almost never its fault; only retry
+    # when stderr actually points at the hardware decode setup
+    hwaccel_hints = ('hwaccel', 'hardware', 'device creation', 'vaapi',
+                     'cuda', 'nvdec', 'qsv', 'videotoolbox')
+
     try:
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            # Check if file was created
-            if os.path.exists(output_file):
-                file_size = os.path.getsize(output_file) / (1024 * 1024)
-                print(f"✅ Conversion successful!")
-                print(f"📁 Output: {output_file}")
-                print(f"📊 Size: {file_size:.2f} MB")
-                return output_file
+        while True:
+            if verbose:
+                print(f"Running: {' '.join(cmd)}")
+                # Stream stderr as it arrives so ffmpeg never stalls on a
+                # full 64 KB OS pipe during long encodes
+                process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.PIPE,
+                                           text=True, bufsize=1 << 20)
+                err_lines = []
+                for line in process.stderr:
+                    print(line, end='')
+                    err_lines.append(line)
+                returncode = process.wait()
+                stderr = ''.join(err_lines)
             else:
+                # Launch non-blocking and drain ffmpeg's machine-readable
+                # progress stream; stderr goes to a temp file instead of
+                # a pipe, since an undrained stderr pipe would fill at
+                # 64 KB and deadlock against the stdout drain
+                with tempfile.TemporaryFile(mode='w+') as errfile:
+                    process = subprocess.Popen(
+                        cmd + ['-progress', 'pipe:1', '-nostats'],
+                        stdout=subprocess.PIPE, stderr=errfile,
+                        text=True, bufsize=1 << 20)
+                    for _line in process.stdout:
+                        # key=value records; consuming them keeps the
+                        # pipe from filling and stalling ffmpeg
+                        pass
+                    returncode = process.wait()
+                    errfile.seek(0)
+                    stderr = errfile.read()
+
+            if (returncode != 0 and hw_args
+                    and any(hint in stderr.lower()
+                            for hint in hwaccel_hints)):
+                print("⚠️ Decode error mentions hardware acceleration, "
+                      "retrying in software...")
+                hw_args = ()
+                cmd = ['ffmpeg', *cmd_tail]
+                continue
+            break
+
+        if returncode == 0:
+            # Check if file was created; one stat gives both the answer
+            # and the size, which callers reuse instead of re-statting
+            try:
+                size_bytes = os.stat(output_file).st_size
+            except FileNotFoundError:
                 print("❌ Output file was not created")
                 return None
+            print(f"✅ Conversion successful!")
+            print(f"📁 Output: {output_file}")
+            print(f"📊 Size: {size_bytes / (1024 * 1024):.2f} MB")
+            return output_file, size_bytes
         else:
             print(f"❌ FFmpeg error:")
-            print(result.stderr)
+            if not verbose:
+                # verbose mode already streamed these lines live
+                print(stderr)
             return None
             
     except Exception as e:
@@ -133,70 +240,352 @@ def convert_mkv_to_webp(input_file, output_file=None,
         return None
 
 
+def parse_frame_rate(fps_str):
+    """Parse ffprobe's 'num/den' frame rate without eval()"""
+    num, _, den = fps_str.partition('/')
+    try:
+        return int(num) / int(den) if den and int(den) else float(num)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def read_exact(stream, n):
+    """Read exactly n bytes from a pipe (short reads are normal there)"""
+    buf = b''
+    while len(buf) < n:
+        chunk = stream.read(n - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def convert_via_pipe(input_file, output_file=None,
+                     start_time=0, duration=None,
+                     fps=12, width=None, height=None,
+                     quality=80, lossless=False,
+                     loop=True, verbose=False,
+                     info=None, accurate_seek=False, **_unused):
+    """
+    Convert by piping raw decoded frames into an in-process WebP encoder
+
+    ffmpeg only decodes and scales; the frames arrive as raw RGB24 over
+    a pipe and Pillow assembles the animation. Decoding once in Python
+    lets the same frames feed several outputs (thumbnails, previews)
+    without a second decode pass. Requires Pillow.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        print("❌ --pipe-encode needs Pillow (pip install Pillow)")
+        return None
+
+    if not check_ffmpeg():
+        print("❌ FFmpeg not found!")
+        install_ffmpeg_suggestion()
+        return None
+
+    if not os.path.exists(input_file):
+        print(f"❌ Input file not found: {input_file}")
+        return None
+
+    if not output_file:
+        base_name = os.path.splitext(input_file)[0]
+        output_file = f"{base_name}_algorithm_viz.webp"
+
+    # Raw frames have no header, so we must know the exact output
+    # geometry before reading the pipe
+    if info is None:
+        info = get_video_info(input_file)
+    src_w = info['width'] if info else None
+    src_h = info['height'] if info else None
+    if width and height:
+        out_w, out_h = width, height
+    elif width and src_w and src_h:
+        out_w, out_h = width, round(src_h * width / src_w)
+    elif height and src_w and src_h:
+        out_w, out_h = round(src_w * height / src_h), height
+    elif src_w and src_h:
+        out_w, out_h = src_w, src_h
+    else:
+        print("❌ Could not determine frame size for pipe mode")
+        return None
+
+    # Only ask for the filters we actually need; a scale to the source
+    # geometry or an fps pass at the source rate is pure overhead
+    src_fps = info['fps'] if info else None
+    filters = []
+    if (out_w, out_h) != (src_w, src_h):
+        filters.append(f'scale={out_w}:{out_h}')
+    if not src_fps or src_fps > fps:
+        filters.append(f'fps={fps}')
+        out_fps = fps
+    else:
+        out_fps = src_fps
+    filter_args = ('-vf', ','.join(filters)) if filters else ()
+
+    # Same seek placement rules as convert_mkv_to_webp: input-side -ss
+    # for the fast path, output-side when frame accuracy is requested
+    seek_args = ()
+    time_args = ()
+    if start_time > 0:
+        if accurate_seek:
+            time_args += ('-ss', str(start_time))
+        else:
+            seek_args += ('-ss', str(start_time))
+    if duration:
+        time_args += ('-t', str(duration))
+
+    frame_bytes = out_w * out_h * 3
+    cmd = ['ffmpeg', *seek_args, '-i', input_file, *time_args,
+           *filter_args, '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+           '-loglevel', 'error', 'pipe:1']
+
+    print(f"Converting {input_file} to {output_file} (pipe mode)...")
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL,
+                                   bufsize=max(1 << 20, frame_bytes * 4))
+        frames = []
+        while True:
+            data = read_exact(process.stdout, frame_bytes)
+            if len(data) < frame_bytes:
+                break
+            frames.append(Image.frombytes('RGB', (out_w, out_h), data))
+        process.wait()
+    except Exception as e:
+        print(f"❌ Error running FFmpeg: {e}")
+        return None
+
+    if process.returncode != 0 or not frames:
+        print("❌ FFmpeg produced no frames")
+        return None
+
+    if verbose:
+        print(f"Encoding {len(frames)} frames with Pillow...")
+    frames[0].save(output_file, 'WEBP', save_all=True,
+                   append_images=frames[1:],
+                   duration=round(1000 / out_fps),
+                   loop=0 if loop else 1,
+                   quality=quality, lossless=lossless)
+
+    size_bytes = os.stat(output_file).st_size
+    print(f"✅ Conversion successful!")
+    print(f"📁 Output: {output_file}")
+    print(f"📊 Size: {size_bytes / (1024 * 1024):.2f} MB")
+    return output_file, size_bytes
+
+
 def get_video_info(input_file):
-    """Get video information using FFprobe"""
+    """Get video information using FFprobe
+
+    Returns a dict with duration/width/height/fps, or None on failure
+    """
     try:
-        cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json', 
-               '-show_format', '-show_streams', input_file]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
+        # Only parse the first video stream; skipping audio/subtitle
+        # streams keeps the demux work and JSON payload small
+        cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json',
+               '-select_streams', 'v:0', '-show_streams', input_file]
+        result = subprocess.run(cmd, capture_output=True, text=True,
+                                bufsize=1 << 20)
+
         if result.returncode == 0:
             import json
             data = json.loads(result.stdout)
-            
-            # Find video stream
-            for stream in data.get('streams', []):
-                if stream.get('codec_type') == 'video':
-                    duration = float(stream.get('duration', 0))
-                    width = stream.get('width', 0)
-                    height = stream.get('height', 0)
-                    fps = eval(stream.get('r_frame_rate', '0/1'))
-                    
-                    print(f"📹 Video Info:")
-                    print(f"   Duration: {duration:.2f} seconds")
-                    print(f"   Resolution: {width}x{height}")
-                    print(f"   Frame rate: {fps:.2f} fps")
-                    return duration, width, height, fps
-                    
+
+            streams = data.get('streams', [])
+            if streams:
+                stream = streams[0]
+                info = {
+                    'duration': float(stream.get('duration', 0)),
+                    'width': stream.get('width', 0),
+                    'height': stream.get('height', 0),
+                    'fps': parse_frame_rate(stream.get('r_frame_rate',
+                                                       '0/1')),
+                }
+
+                # One write instead of four print calls; this runs once
+                # per file in mass --info listings
+                sys.stdout.write(
+                    "📹 Video Info:\n"
+                    "   Duration: %.2f seconds\n"
+                    "   Resolution: %dx%d\n"
+                    "   Frame rate: %.2f fps\n"
+                    % (info['duration'], info['width'], info['height'],
+                       info['fps']))
+                return info
+
     except Exception as e:
         print(f"Could not get video info: {e}")
-    
-    return None, None, None, None
 
+    return None
+
+
+def verify_outputs(paths):
+    """
+    Stat a batch of expected output files, returning (path, size) pairs
+
+    For big batches the stats run on a thread pool so their latency
+    overlaps instead of serializing the loop; below ~50 files the pool
+    setup would cost more than it saves, so those stat inline.
+    """
+    def stat_one(path):
+        try:
+            return path, os.stat(path).st_size
+        except OSError:
+            return None
+
+    if len(paths) < 50:
+        results = map(stat_one, paths)
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+            results = pool.map(stat_one, paths)
+    return [r for r in results if r]
+
+
+def fused_batch_convert(file_pairs, start_time=0, duration=None,
+                        fps=12, width=None, height=None,
+                        quality=80, lossless=False, loop=True,
+                        verbose=False, method=4, accurate_seek=False,
+                        **_unused):
+    """
+    Convert many MKVs with a single ffmpeg invocation
+
+    One process with N inputs and a -filter_complex graph avoids paying
+    subprocess startup and ffmpeg init once per file. The trade-off is
+    that a single bad input fails the whole run, so callers should fall
+    back to per-file conversion on error.
+    """
+    if accurate_seek and start_time > 0:
+        print("⚠️ --accurate-seek is not supported in fused mode; "
+              "using fast input seeking")
+
+    cmd = ['ffmpeg', '-y']
+
+    for input_path, _ in file_pairs:
+        # -ss before each -i gives the same fast per-input seek as the
+        # per-file converter
+        if start_time > 0:
+            cmd.extend(['-ss', str(start_time)])
+        cmd.extend(['-i', input_path])
+
+    # Same scale expression convert_mkv_to_webp builds, applied per input
+    if width and height:
+        scale = f'scale={width}:{height},'
+    elif width:
+        scale = f'scale={width}:-1,'
+    elif height:
+        scale = f'scale=-1:{height},'
+    else:
+        scale = ''
+
+    chains = [f'[{i}:v]{scale}fps={fps}[v{i}]'
+              for i in range(len(file_pairs))]
+    cmd.extend(['-filter_complex', ';'.join(chains)])
+
+    for i, (_, output_path) in enumerate(file_pairs):
+        cmd.extend(['-map', f'[v{i}]'])
+        if duration:
+            cmd.extend(['-t', str(duration)])
+        if lossless:
+            cmd.extend(['-lossless', '1'])
+        else:
+            cmd.extend(['-quality', str(quality)])
+        cmd.extend(['-compression_level', str(method)])
+        if loop:
+            cmd.extend(['-loop', '0'])
+        cmd.append(output_path)
+
+    if not verbose:
+        cmd.extend(['-loglevel', 'error'])
+
+    print(f"Running one fused ffmpeg over {len(file_pairs)} files...")
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True,
+                                bufsize=1 << 20)
+    except Exception as e:
+        print(f"❌ Error running FFmpeg: {e}")
+        return None
+
+    if result.returncode != 0:
+        print("❌ Fused batch failed:")
+        print(result.stderr)
+        return None
+
+    return verify_outputs([out for _, out in file_pairs])
 
-def batch_convert(input_dir, output_dir=None, **kwargs):
+
+def batch_convert(input_dir, output_dir=None, jobs=None, fused=False,
+                  **kwargs):
     """Batch convert MKV files"""
     if not os.path.isdir(input_dir):
         print(f"❌ Directory not found: {input_dir}")
         return
-    
+
     if not output_dir:
         output_dir = input_dir
-    
+
     os.makedirs(output_dir, exist_ok=True)
-    
-    # Find MKV files
-    mkv_files = [f for f in os.listdir(input_dir) 
-                 if f.lower().endswith('.mkv')]
-    
+
+    # Find MKV files; scandir gives us file-type info without an extra
+    # stat per entry, which matters on very large directories
+    with os.scandir(input_dir) as entries:
+        mkv_files = [(e.name, e.path) for e in entries
+                     if e.name.lower().endswith('.mkv')
+                     and e.is_file(follow_symlinks=False)]
+
     if not mkv_files:
         print("No MKV files found")
         return
-    
+
     print(f"Found {len(mkv_files)} MKV files")
-    
+
+    file_pairs = []
+    for name, input_path in mkv_files:
+        output_name = os.path.splitext(name)[0] + '_algorithm_viz.webp'
+        file_pairs.append((input_path, os.path.join(output_dir, output_name)))
+
+    # Fused mode: one ffmpeg process for the whole set; fall back to the
+    # per-file pool if it fails, since it has no per-file isolation
+    if fused:
+        converted = fused_batch_convert(file_pairs, **kwargs)
+        if converted is not None:
+            total_bytes = sum(size for _, size in converted)
+            print(f"\n🎉 Converted {len(converted)}/{len(mkv_files)} files "
+                  f"({total_bytes / (1024 * 1024):.2f} MB of WebP)")
+            return
+        print("Falling back to per-file conversion...")
+
+    if not jobs:
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+
+    # Each encode is independent and mostly single-threaded (libwebp),
+    # so run them in a bounded process pool; cap each child's ffmpeg
+    # threads to avoid oversubscribing the machine
+    kwargs.setdefault('threads', 2)
+
     success_count = 0
-    for mkv_file in mkv_files:
-        input_path = os.path.join(input_dir, mkv_file)
-        output_name = os.path.splitext(mkv_file)[0] + '_algorithm_viz.webp'
-        output_path = os.path.join(output_dir, output_name)
-        
-        print(f"\n--- Converting {mkv_file} ---")
-        result = convert_mkv_to_webp(input_path, output_path, **kwargs)
-        if result:
-            success_count += 1
-    
-    print(f"\n🎉 Converted {success_count}/{len(mkv_files)} files")
+    total_bytes = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for input_path, output_path in file_pairs:
+            print(f"\n--- Queuing {os.path.basename(input_path)} ---")
+            future = executor.submit(convert_mkv_to_webp, input_path,
+                                     output_path, **kwargs)
+            futures[future] = input_path
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ Error converting {futures[future]}: {e}")
+                continue
+            if result:
+                success_count += 1
+                total_bytes += result[1]
+
+    print(f"\n🎉 Converted {success_count}/{len(mkv_files)} files "
+          f"({total_bytes / (1024 * 1024):.2f} MB of WebP)")
 
 
 def main():
@@ -205,20 +594,37 @@ def main():
     parser.add_argument('-o', '--output', help='Output WebP file or directory')
     parser.add_argument('-s', '--start', type=float, default=0, 
                        help='Start time in seconds')
-    parser.add_argument('-d', '--duration', type=float, 
+    parser.add_argument('-d', '--duration', type=float,
                        help='Duration in seconds')
+    parser.add_argument('--accurate-seek', action='store_true',
+                       help='Frame-accurate (but slower) --start seeking')
     parser.add_argument('-f', '--fps', type=int, default=12, 
                        help='Frame rate (default: 12)')
     parser.add_argument('-w', '--width', type=int, help='Width in pixels')
     parser.add_argument('-H', '--height', type=int, help='Height in pixels')
     parser.add_argument('-q', '--quality', type=int, default=80, 
                        help='Quality 0-100 (default: 80)')
-    parser.add_argument('--lossless', action='store_true', 
+    parser.add_argument('--lossless', action='store_true',
                        help='Use lossless compression')
-    parser.add_argument('--no-loop', action='store_true', 
+    parser.add_argument('-m', '--method', type=int, default=4,
+                       choices=range(0, 7),
+                       help='WebP compression effort 0-6 (default: 4)')
+    parser.add_argument('--no-loop', action='store_true',
                        help='Disable looping')
-    parser.add_argument('--batch', action='store_true', 
+    parser.add_argument('--no-hwaccel', action='store_true',
+                       help='Disable hardware-accelerated decoding')
+    parser.add_argument('--pipe-encode', action='store_true',
+                       help='Decode via pipe and encode with Pillow '
+                            '(requires Pillow)')
+    parser.add_argument('--batch', action='store_true',
                        help='Batch process directory')
+    parser.add_argument('--fused-batch', action='store_true',
+                       help='Batch with one ffmpeg process for all files '
+                            '(faster startup, no per-file isolation)')
+    parser.add_argument('-j', '--jobs', type=int,
+                       default=max(1, (os.cpu_count() or 2) // 2),
+                       help='Parallel conversions in batch mode '
+                            '(default: half the CPUs)')
     parser.add_argument('-v', '--verbose', action='store_true', 
                        help='Verbose output')
     parser.add_argument('--info', action='store_true', 
@@ -237,32 +643,46 @@ def main():
     # Conversion parameters
     params = {
         'start_time': args.start,
+        'accurate_seek': args.accurate_seek,
         'duration': args.duration,
         'fps': args.fps,
         'width': args.width,
         'height': args.height,
         'quality': args.quality,
         'lossless': args.lossless,
+        'method': args.method,
         'loop': not args.no_loop,
-        'verbose': args.verbose
+        'verbose': args.verbose,
+        'hwaccel': not args.no_hwaccel
     }
     
     try:
         if args.batch or os.path.isdir(args.input):
-            batch_convert(args.input, args.output, **params)
+            batch_convert(args.input, args.output, jobs=args.jobs,
+                          fused=args.fused_batch, **params)
         else:
-            # Show video info first
+            # Show video info first and reuse the probe for conversion
             print("📹 Analyzing input video...")
-            get_video_info(args.input)
+            info = get_video_info(args.input)
             print()
-            
-            # Convert
-            result = convert_mkv_to_webp(args.input, args.output, **params)
-            
+
+            # Convert; let the converter report a missing input instead
+            # of tripping over the stat here
+            if os.path.isfile(args.input):
+                original_size = os.stat(args.input).st_size / (1024 * 1024)
+            else:
+                original_size = 0
+            if args.pipe_encode:
+                result = convert_via_pipe(args.input, args.output,
+                                          info=info, **params)
+            else:
+                result = convert_mkv_to_webp(args.input, args.output,
+                                             info=info, **params)
+
             if result:
-                # Show file size comparison
-                original_size = os.path.getsize(args.input) / (1024 * 1024)
-                webp_size = os.path.getsize(result) / (1024 * 1024)
+                # Show file size comparison, reusing the size the
+                # conversion already statted
+                webp_size = result[1] / (1024 * 1024)
                 compression = (1 - webp_size / original_size) * 100
                 
                 print(f"\n📊 Compression:")